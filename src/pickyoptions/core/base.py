@@ -263,6 +263,11 @@ class BaseMixin(object):
         routine = cls(self, id, **kwargs)
         self.routines.append(routine)
 
+    def create_routines(self, *ids, **kwargs):
+        from pickyoptions.core.routine.routine import Routine
+        cls = kwargs.pop('cls', None) or Routine
+        self.routines.extend([cls(self, id, **kwargs) for id in ids])
+
     def reset_routines(self):
         self.routines.reset()
 
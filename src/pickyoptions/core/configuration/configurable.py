@@ -1,6 +1,7 @@
 from copy import deepcopy
 import logging
 import six
+import sys
 
 from pickyoptions import settings
 from pickyoptions.core.base import Base, BaseMixin
@@ -24,6 +25,35 @@ from .utils import require_configured
 logger = logging.getLogger(settings.PACKAGE_NAME)
 
 
+def _validate_child_field(child, field):
+    """
+    Validates the field provided to a configurable child, raising an error
+    on the child if it is invalid, and returns the field.
+
+    The field is used as a key when looking up the child on the parent, so the
+    returned field is interned to make those lookups cheaper.
+    """
+    if not isinstance(field, six.string_types):
+        # TODO: Make sure this doesn't put the exception in the context of
+        # the option field, in the exception message.
+        child.raise_invalid_configuration_type(
+            value=field,
+            types=six.string_types,
+            name='field'
+        )
+    elif field.startswith('_'):
+        # TODO: Make sure this doesn't put the exception in the context of the
+        # option field, in the exception message.
+        child.raise_invalid_configuration(
+            name='field',
+            value=field,
+            detail="It cannot be scoped as a private attribute."
+        )
+    if type(field) is str:
+        field = sys.intern(field)
+    return field
+
+
 class ConfigurableMixin(BaseMixin):
     errors = {
         'not_configured_error': NotConfiguredError,
@@ -112,14 +142,14 @@ class ConfigurableMixin(BaseMixin):
     @require_not_in_progress(id="configuration")
     def pre_configuration(self):
         if self.configured:
-            logger.debug("Reconfiguring %s." % self)
+            logger.debug("Reconfiguring %s.", self)
         else:
-            logger.debug("Configuring %s." % self)
+            logger.debug("Configuring %s.", self)
 
     @require_finished(id="configuration")
     @require_configured
     def post_configuration(self):
-        logger.debug("Done configuring %s." % self)
+        logger.debug("Done configuring %s.", self)
         self.validate_configuration()
 
     def assert_configured(self):
@@ -205,23 +235,7 @@ class ConfigurableChild(Configurable, ChildMixin):
         super(ConfigurableChild, self).__init__(**kwargs)
         ChildMixin._init(self, parent=parent)
 
-        self._field = field
-        if not isinstance(self._field, six.string_types):
-            # TODO: Make sure this doesn't put the exception in the context of
-            # the option field, in the exception message.
-            self.raise_invalid_configuration_type(
-                value=self._field,
-                types=six.string_types,
-                name='field'
-            )
-        elif self._field.startswith('_'):
-            # TODO: Make sure this doesn't put the exception in the context of
-            # the option field, in the exception message.
-            self.raise_invalid_configuration(
-                name='field',
-                value=self._field,
-                detail="It cannot be scoped as a private attribute."
-            )
+        self._field = _validate_child_field(self, field)
 
     @property
     def field(self):
@@ -287,23 +301,7 @@ class ConfigurationsConfigurableChild(ConfigurationsConfigurable, ChildMixin):
     def __init__(self, field, parent=None, **kwargs):
         super(ConfigurationsConfigurableChild, self).__init__(**kwargs)
         ChildMixin._init(self, parent=parent)
-        self._field = field
-        if not isinstance(self._field, six.string_types):
-            # TODO: Make sure this doesn't put the exception in the context of
-            # the option field, in the exception message.
-            self.raise_invalid_configuration_type(
-                value=self._field,
-                types=six.string_types,
-                name='field'
-            )
-        elif self._field.startswith('_'):
-            # TODO: Make sure this doesn't put the exception in the context of
-            # the option field, in the exception message.
-            self.raise_invalid_configuration(
-                name='field',
-                value=self._field,
-                detail="It cannot be scoped as a private attribute."
-            )
+        self._field = _validate_child_field(self, field)
 
     @property
     def field(self):
@@ -1,5 +1,3 @@
-import six
-
 from pickyoptions import constants
 
 from pickyoptions.lib.utils import get_num_function_arguments
@@ -16,6 +14,10 @@ class CallableConfiguration(Configuration):
             default=None)
         self._num_arguments = num_arguments
         self._error_message = error_message or "Must be a callable."
+        # The callable that was last validated, along with it's number of
+        # arguments, since the same callable is validated each time the
+        # configuration is validated and the introspection is expensive.
+        self._num_found_arguments = (None, None)
 
     @property
     def num_arguments(self):
@@ -36,13 +38,16 @@ class CallableConfiguration(Configuration):
         yield super(CallableConfiguration, self).do_validate_value(value,
             return_children=True)
         if value is not None and value != constants.EMPTY:
-            if not six.callable(value):
+            if not callable(value):
                 yield self.raise_invalid(
                     message=self.error_message,
                     return_exception=True,
                 )
             elif self.num_arguments is not None:
-                num_found_arguments = get_num_function_arguments(value)
+                if self._num_found_arguments[0] is not value:
+                    self._num_found_arguments = (
+                        value, get_num_function_arguments(value))
+                num_found_arguments = self._num_found_arguments[1]
                 if num_found_arguments != self.num_arguments:
                     yield self.raise_invalid(
                         message=self.error_message,
@@ -54,6 +59,9 @@ class TypesConfiguration(Configuration):
     __abstract__ = False
 
     def __init__(self, field):
+        # The types of the last value that was checked against, along with
+        # the types as a `obj:frozenset` for faster membership checks.
+        self._types_set = (None, frozenset())
         super(TypesConfiguration, self).__init__(field, default=None)
 
     def normalize(self, value):
@@ -67,7 +75,7 @@ class TypesConfiguration(Configuration):
             return_children=True, detail=detail)
         if value is not None and value != constants.EMPTY:
             if (not hasattr(value, '__iter__')
-                    or isinstance(value, six.string_types)):
+                    or isinstance(value, str)):
                 yield self.raise_invalid(
                     message="The configuration {name} be an iterable of types.",
                     return_exception=True,
@@ -91,8 +99,17 @@ class TypesConfiguration(Configuration):
         specified by this configuration.
         """
         self.assert_set()
-        if self.provided and self.value is not None:
-            assert type(self.value) is tuple
-            if value is None or not isinstance(value, self.value):
-                return False
+        if self.provided:
+            types = self.value
+            if types is not None:
+                assert types.__class__ is tuple
+                if value is None:
+                    return False
+                if self._types_set[0] is not types:
+                    self._types_set = (types, frozenset(types))
+                # Check the exact type first, since it is the common case and
+                # avoids walking the MRO of the value for each type.
+                if (type(value) not in self._types_set[1]
+                        and not isinstance(value, types)):
+                    return False
         return True
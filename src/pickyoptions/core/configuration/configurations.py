@@ -1,4 +1,5 @@
 import logging
+from types import MappingProxyType
 
 from pickyoptions import settings, constants
 
@@ -30,6 +31,11 @@ class Configurations(ConfigurableParent):
             *kwargs
         )
 
+        # Mapping of fields to the `obj:Configuration`(s) that were explicitly
+        # provided a value, maintained as the `obj:Configurations` are
+        # configured.
+        self._explicitly_set = {}
+
         # Pass overridden errors down through to the individual
         # `obj:Configuration` children.
         for configuration in self.children:
@@ -97,6 +103,7 @@ class Configurations(ConfigurableParent):
                 configuration.raise_cannot_reconfigure()
 
             configuration.configure(v)
+            self._explicitly_set[k] = configuration
 
             # Validate the overall configuration after the configuration is set.
             self.validate()
@@ -133,19 +140,24 @@ class Configurations(ConfigurableParent):
         # It is important here that we loop over all the `obj:Configurations`,
         # because configuring should replace all of the `obj:Configuration`
         # values.
+        self._explicitly_set = {}
         for field, configuration in self:
             if field in kwargs:
                 configuration.value = kwargs[field]
+                self._explicitly_set[field] = configuration
             else:
                 configuration.set_default()
 
     @property
     def explicitly_set_configurations(self):
-        data = {}
-        for field, configuration in self:
-            if configuration.configured:
-                data[field] = configuration
-        return data
+        """
+        Returns the `obj:Configuration`(s) that were explicitly provided a value
+        when the `obj:Configurations` were configured, indexed by their field.
+
+        The mapping is read-only, since it is maintained by the
+        `obj:Configurations` as they are configured.
+        """
+        return MappingProxyType(self._explicitly_set)
 
     @property
     def explicitly_set_configuration_values(self):
@@ -26,14 +26,15 @@ class ChildInvalidError(ValueInvalidError, ChildError):
 
 
 class ChildTypeError(ValueTypeError, ChildInvalidError):
+    # The default messages for when the types are and are not provided.
+    types_message = "The child `{name}` must be of type {types}."
+    no_types_message = "The child `{name}` is of invalid type."
+
     @property
     def default_message(self):
-        types = getattr(self, 'types', None)
-        if types:
-            if len(types) != 0:
-                return "The child `{name}` must be of type {types}."
-            return "The child `{name}` is not of the correct type."
-        return "The child `{name}` is of invalid type."
+        if self._injection.get('types'):
+            return self.types_message
+        return self.no_types_message
 
 
 # TODO: Should this be a parent error instead?
@@ -151,14 +152,8 @@ class ConfigurationTypeError(ChildTypeError, ConfigurationInvalidError):
     Raised when the value supplied to the `obj:Configuration` is of the
     incorrect type.
     """
-    @property
-    def default_message(self):
-        types = getattr(self, 'types', None)
-        if types:
-            if len(types) != 0:
-                return "The configuration {name} must be of type {types}."
-            return "The configuration {name} is not of the correct type."
-        return "The configuration {name} is of invalid type."
+    types_message = "The configuration {name} must be of type {types}."
+    no_types_message = "The configuration {name} is of invalid type."
 
 
 class ConfigurationValidationError(ConfigurationError):
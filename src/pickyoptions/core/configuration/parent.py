@@ -22,6 +22,10 @@ class ParentMixin(BaseMixin):
 
     def _init(self, children=None, child_value=None):
         self._children = []
+        # Mapping of fields to the children, maintained as children are
+        # assigned and removed, so that children can be looked up (and their
+        # presence checked) without scanning the children.
+        self._children_by_field = {}
         self._child_value = child_value
         if self._child_value is not None:
             assert six.callable(self._child_value)
@@ -48,7 +52,7 @@ class ParentMixin(BaseMixin):
         if not isinstance(child, six.string_types):
             self.validate_child(child)
             field = child.field
-        return field in self.fields
+        return field in self._children_by_field
 
     @children.setter
     def children(self, children):
@@ -106,18 +110,30 @@ class ParentMixin(BaseMixin):
                 else child.field
             ))
 
+    def raise_if_children_missing(self, fields):
+        """
+        Raises an error for the first of the provided fields that does not
+        correspond to a child.  The check is done with a set difference, so the
+        fields are only iterated over in Python when one is missing.
+        """
+        missing = set(fields) - self._children_by_field.keys()
+        if missing:
+            # Raise for the first missing field in the order provided.
+            self.raise_child_does_not_exist(
+                name=[field for field in fields if field in missing][0])
+
     @raise_with_error(error='does_not_exist_error')
     def raise_child_does_not_exist(self, *args, **kwargs):
         super(ParentMixin, self).raise_with_self(*args, **kwargs)
 
     def get_child(self, k):
-        try:
-            return [
-                child for child in self.children
-                if child.field == k
-            ][0]
-        except IndexError:
+        # The error is raised outside of an except block so that it does not
+        # carry an implicit KeyError context (this is hit frequently via
+        # hasattr() probes).
+        child = self._children_by_field.get(k)
+        if child is None:
             self.raise_child_does_not_exist(name=k)
+        return child
 
     def new_children(self, children):
         self.remove_children()
@@ -130,6 +146,7 @@ class ParentMixin(BaseMixin):
         if not self.has_child(child):
             raise ValueError()
         self._children.remove(child)
+        self._children_by_field.pop(child.field, None)
 
     def assign_child(self, child):
         self.validate_child(child)
@@ -138,6 +155,7 @@ class ParentMixin(BaseMixin):
 
         # This must come first to prevent a recursion error between parent/child.
         self._children.append(child)
+        self._children_by_field[child.field] = child
         if not child.assigned:
             child.assign_parent(self)
         else:
@@ -1,6 +1,19 @@
 import functools
 
 
+# The `obj:ConfigurableMixin` cannot be imported at the module level because of
+# circular imports, so it is imported the first time it is needed.
+_configurable_cls = None
+
+
+def get_configurable_cls():
+    global _configurable_cls
+    if _configurable_cls is None:
+        from .configurable import ConfigurableMixin
+        _configurable_cls = ConfigurableMixin
+    return _configurable_cls
+
+
 def require_configured(func):
     """
     Decorator to ensure that the instance is configured before proceeding.
@@ -9,9 +22,7 @@ def require_configured(func):
     """
     @functools.wraps(func)
     def inner(instance, *args, **kwargs):
-        from .configurable import ConfigurableMixin
-
-        assert isinstance(instance, ConfigurableMixin)
+        assert isinstance(instance, get_configurable_cls())
         if not instance.configured:
             instance.raise_not_configured()
         return func(instance, *args, **kwargs)
@@ -31,10 +42,38 @@ def require_configured_property(func):
     """
     @property
     def inner(instance, *args, **kwargs):
-        from .configurable import ConfigurableMixin
-
-        assert isinstance(instance, ConfigurableMixin)
+        assert isinstance(instance, get_configurable_cls())
         if not instance.configured:
             instance.raise_not_configured()
         return func(instance, *args, **kwargs)
     return inner
+
+
+class lazy_configurations(object):
+    """
+    Decorator for a method of a `obj:ConfigurationsConfigurable` class that
+    returns the `obj:Configurations` for the class.  The `obj:Configurations`
+    are not built until they are first accessed from an instance of the class,
+    at which point they replace the decorated method on the class.
+
+    This prevents the `obj:Configurations` from being constructed when the
+    module is imported.
+
+    The `obj:Configurations` are only built once, and are shared by the class
+    and any subclasses that do not override them.  This is safe because each
+    instance works with it's own copy of the `obj:Configurations`.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.configurations = None
+        functools.update_wrapper(self, func)
+
+    def __get__(self, instance, owner):
+        # Accessing the attribute on the class (which happens when the class is
+        # created) should not build the `obj:Configurations`.
+        if instance is None:
+            return self
+        if self.configurations is None:
+            self.configurations = self.func(owner)
+        type.__setattr__(owner, self.__name__, self.configurations)
+        return self.configurations
@@ -88,6 +88,21 @@ def raise_with_error(error=None, **kws):
     return decorator
 
 
+# The `obj:Configuration` and `obj:Option` classes cannot be imported at the
+# module level because of circular imports, so they are imported the first time
+# they are needed.
+_valued_classes = None
+
+
+def get_valued_classes():
+    global _valued_classes
+    if _valued_classes is None:
+        from pickyoptions.core.configuration import Configuration
+        from pickyoptions.core.options import Option
+        _valued_classes = (Configuration, Option)
+    return _valued_classes
+
+
 def require_set(func):
     """
     Decorator to ensure that the instance value is set before proceeding.
@@ -97,10 +112,7 @@ def require_set(func):
     """
     @functools.wraps(func)
     def inner(instance, *args, **kwargs):
-        from pickyoptions.core.configuration import Configuration
-        from pickyoptions.core.options import Option
-
-        assert isinstance(instance, (Configuration, Option))
+        assert isinstance(instance, get_valued_classes())
         if not instance.set:
             instance.raise_not_set()
         return func(instance, *args, **kwargs)
@@ -121,10 +133,7 @@ def require_set_property(func):
     """
     @property
     def inner(instance, *args, **kwargs):
-        from pickyoptions.core.configuration import Configuration
-        from pickyoptions.core.options import Option
-
-        assert isinstance(instance, (Configuration, Option))
+        assert isinstance(instance, get_valued_classes())
         if not instance.set:
             instance.raise_not_set()
         return func(instance, *args, **kwargs)
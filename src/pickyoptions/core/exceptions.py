@@ -2,6 +2,9 @@ from abc import ABCMeta
 from copy import deepcopy
 import logging
 import six
+import string
+import sys
+from types import MappingProxyType
 
 from pickyoptions import settings
 from pickyoptions.lib.utils import (
@@ -16,6 +19,37 @@ def make_bold(value):
     return "\033[1m" + "%s" % value + "\033[0;0m"
 
 
+# The placeholders of the class level `default_message` templates, which are
+# parsed once when each exception class is created.  Ad-hoc messages provided
+# to the exception instances are not stored here, so the mapping only grows
+# with the number of exception classes.
+_DEFAULT_TEMPLATE_PLACEHOLDERS = {}
+
+
+def get_template_placeholders(template):
+    """
+    Returns the names of the placeholders in the provided message template.
+    """
+    placeholders = _DEFAULT_TEMPLATE_PLACEHOLDERS.get(template)
+    if placeholders is None:
+        placeholders = frozenset([
+            field_name for _, field_name, _, _
+            in string.Formatter().parse(template)
+            if field_name is not None
+        ])
+    return placeholders
+
+
+def format_template(template, injection):
+    """
+    Formats the message template with the provided injection.
+    """
+    # Constant messages do not need to be formatted at all.
+    if '{' not in template and '}' not in template:
+        return template
+    return template.format_map(injection)
+
+
 # Until we figure out how to appropriately use the __new__ method for an object,
 # without the name, bases and dct attrributes, we have to use the ABCMeta as our
 # base.
@@ -27,8 +61,8 @@ class PickyOptionsErrorMeta(ABCMeta):
         # Conglomerate Default Injection from Parents
         default_injections = []
         for parent in bases:
-            base_injection = deepcopy(getattr(parent, 'default_injection', {}))
-            assert isinstance(base_injection, dict)
+            base_injection = deepcopy(
+                dict(getattr(parent, 'default_injection', {})))
             default_injections.append(base_injection)
         default_injection = merge_dicts(default_injections)
 
@@ -37,8 +71,10 @@ class PickyOptionsErrorMeta(ABCMeta):
         assert isinstance(this_default_injection, dict)
         default_injection.update(this_default_injection)
 
-        # Set the class default injection as the combined injections.
-        dct['default_injection'] = default_injection
+        # Set the class default injection as the combined injections.  The
+        # combined injection is shared by every instance of the class, so it
+        # is exposed as a read-only view to prevent accidental mutation.
+        dct['default_injection'] = MappingProxyType(default_injection)
 
         # Conglomerate Ignore Prefix Injection from Parents
         ignore_prefix_injections = []
@@ -53,6 +89,26 @@ class PickyOptionsErrorMeta(ABCMeta):
         dct['ignore_prefix_injections'] = merge_lists(
             ignore_prefix_injections, cast=tuple)
 
+        # Intern the identifier and default message of the class, so that
+        # comparing or grouping errors by them can short-circuit on identity.
+        if isinstance(dct.get('identifier'), str):
+            dct['identifier'] = sys.intern(dct['identifier'])
+
+        # Parse the placeholders of the class's default message template up
+        # front, so the work is done once at import instead of on the first
+        # raise.  Messages that are properties are only known per instance.
+        default_message = dct.get('default_message')
+        if isinstance(default_message, str):
+            default_message = dct['default_message'] = sys.intern(
+                default_message)
+            try:
+                _DEFAULT_TEMPLATE_PLACEHOLDERS[default_message] = \
+                    get_template_placeholders(default_message)
+            except ValueError:
+                # The message is not a valid template - this will be surfaced
+                # when the message is formatted.
+                pass
+
         return super(PickyOptionsErrorMeta, cls).__new__(cls, name, bases, dct)
 
 
@@ -100,10 +156,14 @@ class PickyOptionsError(six.with_metaclass(PickyOptionsErrorMeta, Exception)):
         # NOTE: This has to come after the injectable arguments are set, because
         # the default message sometimes accesses the injectable arguments set
         # on the instance.
-        self._message = (
-            args[0] if len(args) != 0
-            else kwargs.pop('message', self.default_message)
-        )
+        # The default message is only looked up if a message is not provided,
+        # since it is a property on some exception classes.
+        if len(args) != 0:
+            self._message = args[0]
+        elif 'message' in kwargs:
+            self._message = kwargs.pop('message')
+        else:
+            self._message = self.default_message
 
     def configure_self_and_children(self, **kwargs):
         self._index = kwargs.pop('index', 0)
@@ -146,6 +206,22 @@ class PickyOptionsError(six.with_metaclass(PickyOptionsErrorMeta, Exception)):
             self._injection[k] = v
         else:
             super(PickyOptionsError, self).__setattr__(k, v)
+        # The formatted message depends on the injection and the message
+        # template, so it has to be rebuilt after either changes.
+        if k != '_message_cache':
+            self.__dict__['_message_cache'] = None
+
+    def __copy__(self):
+        # Creating the copy with __new__ means that it does not carry over the
+        # __traceback__ (and the frames it references) or the __context__ of
+        # the original, which matters when errors are stored for later use.
+        cls = self.__class__
+        result = cls.__new__(cls)
+        result.__dict__.update(self.__dict__)
+        # The injection is copied so that setting values on the copy does not
+        # alter the original.
+        result.__dict__['_injection'] = dict(self._injection)
+        return result
 
     def __deepcopy__(self, memo):
         cls = self.__class__
@@ -225,15 +301,23 @@ class PickyOptionsError(six.with_metaclass(PickyOptionsErrorMeta, Exception)):
 
     @property
     def injection(self):
+        # The message template is only parsed once for all of the injected
+        # values.
+        try:
+            placeholders = get_template_placeholders(self._message)
+        except (TypeError, ValueError):
+            placeholders = None
+
         injection = {}
         prefix_injection = {}
         for k, v in self._injection.items():
-            if self._has_injection_placeholder(k):
+            if self._has_injection_placeholder(k, placeholders=placeholders):
                 injection[k] = v
             else:
                 prefix_injection[k] = v
         for k, v in self.default_injection.items():
-            if k not in injection and self._has_injection_placeholder(k):
+            if k not in injection and self._has_injection_placeholder(
+                    k, placeholders=placeholders):
                 injection[k] = v
         return injection, prefix_injection
 
@@ -241,8 +325,14 @@ class PickyOptionsError(six.with_metaclass(PickyOptionsErrorMeta, Exception)):
     def children(self):
         return self._children
 
-    def _has_injection_placeholder(self, argument):
-        return "{%s}" % argument in self._message
+    def _has_injection_placeholder(self, argument, placeholders=None):
+        if placeholders is None:
+            try:
+                placeholders = get_template_placeholders(self._message)
+            except (TypeError, ValueError):
+                # The message is either not hashable or not a valid template.
+                return "{%s}" % argument in self._message
+        return argument in placeholders
 
     @property
     def identifier(self):
@@ -261,10 +351,16 @@ class PickyOptionsError(six.with_metaclass(PickyOptionsErrorMeta, Exception)):
 
     @property
     def message(self):
-        injection, prefix_injection = self.injection
-        message = self._message.format(**injection)
-        if not message.endswith('.'):
-            message = "%s." % message
+        # The message is only formatted when it is needed (i.e. when the
+        # exception is stringified) and then cached, since exceptions are
+        # frequently raised and caught without ever being displayed.
+        message = self.__dict__.get('_message_cache')
+        if message is None:
+            injection, prefix_injection = self.injection
+            message = format_template(self._message, injection)
+            if not message.endswith('.'):
+                message = "%s." % message
+            self._message_cache = message
         return message
 
     @property
@@ -1,3 +1,10 @@
+# Types whose instances cannot be mutated and do not reference other objects, so
+# they do not need to be deep copied.  Containers like `obj:tuple` are excluded
+# because they can contain mutable values.
+ATOMIC_TYPES = frozenset([
+    type(None), bool, int, float, complex, str, bytes, type])
+
+
 class OptionsState(object):
     NOT_INITIALIZED = "NOT_INITIALIZED"
     NOT_POPULATED = "NOT_POPULATED"
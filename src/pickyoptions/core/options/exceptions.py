@@ -165,10 +165,5 @@ class OptionTypeError(ChildTypeError, OptionInvalidError):
     """
     # Required to be specified because of the inheritance pattern.
     identifier = "Invalid Option"
-
-    @property
-    def default_message(self):
-        types = getattr(self, 'types', None)
-        if types:
-            return "The option {name} must be of type {types}."
-        return "The option {name} is not of the correct type."
+    types_message = "The option {name} must be of type {types}."
+    no_types_message = "The option {name} is not of the correct type."
@@ -4,7 +4,10 @@ from pickyoptions.core.base import BaseMixin
 
 class PopulatingMixin(BaseMixin):
     """
-    Requires that the class instance has a routine with id populating.
+    Requires that the class instance has a routine with id populating, and
+    that a reference to it is stored as `_populating_routine` when the instance
+    is created (so the state checks do not have to look it up in the
+    `obj:Routines`).
     """
     required_errors = (
         'not_populated_error',
@@ -12,17 +15,22 @@ class PopulatingMixin(BaseMixin):
         'populated_error',
     )
 
+    # The assertions return early in the common case that they pass, so the
+    # raise is the fall through.
     def assert_not_populated(self, *args, **kwargs):
-        if self.populated:
-            self.raise_populated(*args, **kwargs)
+        if not self.populated:
+            return
+        self.raise_populated(*args, **kwargs)
 
     def assert_populated(self, *args, **kwargs):
-        if not self.populated:
-            self.raise_not_populated(*args, **kwargs)
+        if self.populated:
+            return
+        self.raise_not_populated(*args, **kwargs)
 
     def assert_populated_or_populating(self, *args, **kwargs):
-        if not self.populated:
-            self.raise_not_populated(*args, **kwargs)
+        if self.populated or self.populating:
+            return
+        self.raise_not_populated_or_populating(*args, **kwargs)
 
     @raise_with_error(error='not_populated_error')
     def raise_not_populated(self, *args, **kwargs):
@@ -41,8 +49,8 @@ class PopulatingMixin(BaseMixin):
 
     @property
     def populated(self):
-        return self.routines.populating.finished
+        return self._populating_routine.finished
 
     @property
     def populating(self):
-        return self.routines.populating.in_progress
+        return self._populating_routine.in_progress
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 import logging
 import six
 import sys
@@ -7,6 +7,7 @@ from pickyoptions import settings, constants
 
 from pickyoptions.core.base import lazy
 from pickyoptions.core.exceptions import PickyOptionsError
+from pickyoptions.core.routine import Routine
 from pickyoptions.core.decorators import require_set, accumulate_errors
 
 from pickyoptions.core.configuration import (
@@ -16,8 +17,9 @@ from pickyoptions.core.configuration.configuration_lib import (
 from pickyoptions.core.configuration.exceptions import (
     ConfigurationDoesNotExistError)
 from pickyoptions.core.configuration.utils import (
-    require_configured, require_configured_property)
+    require_configured, require_configured_property, lazy_configurations)
 
+from .constants import ATOMIC_TYPES
 from .exceptions import (
     OptionInvalidError,
     OptionRequiredError,
@@ -37,6 +39,7 @@ from .exceptions import (
     OptionNotRequiredError
 )
 from .mixins import PopulatingMixin
+from .utils import get_option_classes
 
 
 logger = logging.getLogger(settings.PACKAGE_NAME)
@@ -46,6 +49,59 @@ logger = logging.getLogger(settings.PACKAGE_NAME)
 VALIDATE_NORMALIZED_VALUE_IF_SAME = False
 VALIDATE_NORMALIZED_VALUE_IF_ORIGINAL_INVALID = True
 
+# Error messages shared by the `obj:CallableConfiguration`(s) of the `obj:Option`
+# that take 2 and 3 arguments respectively.
+_ERR_2ARG = sys.intern(
+    "Must be a callable that takes the option value as it's first argument "
+    "and the option instance as it's second argument."
+)
+_ERR_3ARG = sys.intern(
+    "Must be a callable that takes the option value as it's first argument, "
+    "the option instance as it's second argument and the overall combined "
+    "options instance as it's third argument."
+)
+
+# Exceptions raised by user provided validation methods that indicate the value
+# is invalid, as opposed to an unexpected error in the validation method.
+_RAISE_TYPES = (OptionsInvalidError, OptionInvalidError)
+
+_STR_TYPES = six.string_types
+
+# Attributes of the `obj:Option` that reference objects the `obj:Option` does not
+# own (or that are never mutated after initialization, like the saved
+# initialization state), and are thus not deep copied along with the
+# `obj:Option`.
+_SHALLOW_FIELDS = frozenset([
+    '_parent', '__lazyinitargs__', '__lazyinitkwargs__'])
+
+# Attributes of the `obj:Option` that can be mutated but only contain values that
+# do not need to be copied (i.e. the mapping of error names to exception
+# classes), so a shallow copy is sufficient.
+_COPIED_FIELDS = frozenset(['errors'])
+
+# Attributes of the `obj:Option` that hold the state of it's routines, which
+# have to be copied even for shallow copies since the routines reference the
+# `obj:Option` they operate on.
+_ROUTINE_FIELDS = frozenset([
+    'routines', '_value_routines', '_populating_routine',
+    '_overriding_routine', '_restoring_routine'])
+
+
+class OptionRoutine(Routine):
+    """
+    A `obj:Routine` for the populating, overriding and restoring routines of an
+    `obj:Option` that keeps count of how many of them are in progress on the
+    `obj:Option`.
+    """
+    def __enter__(self):
+        routine = super(OptionRoutine, self).__enter__()
+        self._instance._routines_in_progress += 1
+        return routine
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._instance._routines_in_progress -= 1
+        return super(OptionRoutine, self).__exit__(exc_type, exc_val, exc_tb)
+
 
 class Option(ConfigurationsConfigurableChild, PopulatingMixin):
     """
@@ -56,6 +112,13 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
     field: `obj:str`
         The field that the value is associated with.
 
+    parent: `obj:Options` (optional)
+        The `obj:Options` instance that the `obj:Option` belongs to.  This is
+        not a configuration of the `obj:Option`, so it is not saved for the
+        lazy configuration.
+
+        Default: None
+
     required: `obj:bool` (optional)
         Whether or not the `obj:Option` value is required.  When the
         `obj:Options` are populated, if the value for a required `obj:Option`
@@ -156,77 +219,98 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
     # Child Implementation Properties
     parent_cls = 'Options'
 
-    configurations = Configurations(
-        Configuration('default', default=constants.EMPTY),
-        Configuration('required', types=(bool, ), default=False),
-        Configuration('allow_null', types=(bool, ), default=False),
-        Configuration('locked', types=(bool, ), default=False),
-        Configuration('post_process_on_default', types=(bool, ), default=False),
-        # TODO: Consider allowing types to take on None as a value.
-        Configuration('enforce_types_on_null', types=(bool, ), default=True),
-        TypesConfiguration('types'),
-        CallableConfiguration(
-            'validate',
-            num_arguments=2,
-            error_message=(
-                "Must be a callable that takes the option value as it's "
-                "first argument and the option instance as it's second "
-                "argument."
-            )
-        ),
-        CallableConfiguration(
-            'validate_with_options',
-            num_arguments=3,
-            error_message=(
-                "Must be a callable that takes the option value as it's "
-                "first argument, the option instance as it's second argument "
-                "and the overall combined options instance as it's third "
-                "argument."
-            )
-        ),
-        CallableConfiguration(
-            'normalize',
-            num_arguments=2,
-            error_message=(
-                "Must be a callable that takes the option value as it's "
-                "first argument and the option instance as it's second "
-                "argument."
-            )
-        ),
-        CallableConfiguration(
-            'post_process',
-            num_arguments=2,
-            error_message=(
-                "Must be a callable that takes the option value as it's "
-                "first argument and the option instance as it's second "
-                "argument."
-            )
-        ),
-        CallableConfiguration(
-            'post_process_with_options',
-            num_arguments=3,
-            error_message=(
-                "Must be a callable that takes the option value as it's "
-                "first argument, the option instance as it's second argument "
-                "and the overall combined options instance as it's third "
-                "argument."
-            )
-        ),
-        Configuration("help_text", default="", types=six.string_types),
-        validation_error=OptionInvalidError,
-    )
-
-    def __init__(self, field, **kwargs):
-        super(Option, self).__init__(field, **kwargs)
+    @lazy_configurations
+    def configurations(cls):
+        return Configurations(
+            Configuration('default', default=constants.EMPTY),
+            Configuration('required', types=(bool, ), default=False),
+            Configuration('allow_null', types=(bool, ), default=False),
+            Configuration('locked', types=(bool, ), default=False),
+            Configuration(
+                'post_process_on_default', types=(bool, ), default=False),
+            # TODO: Consider allowing types to take on None as a value.
+            Configuration(
+                'enforce_types_on_null', types=(bool, ), default=True),
+            TypesConfiguration('types'),
+            CallableConfiguration(
+                'validate',
+                num_arguments=2,
+                error_message=_ERR_2ARG
+            ),
+            CallableConfiguration(
+                'validate_with_options',
+                num_arguments=3,
+                error_message=_ERR_3ARG
+            ),
+            CallableConfiguration(
+                'normalize',
+                num_arguments=2,
+                error_message=_ERR_2ARG
+            ),
+            CallableConfiguration(
+                'post_process',
+                num_arguments=2,
+                error_message=_ERR_2ARG
+            ),
+            CallableConfiguration(
+                'post_process_with_options',
+                num_arguments=3,
+                error_message=_ERR_3ARG
+            ),
+            Configuration("help_text", default="", types=six.string_types),
+            validation_error=OptionInvalidError,
+        )
+
+    def __init__(self, field, parent=None, **kwargs):
+        # Mapping of field names to the `obj:Configuration`(s) of the
+        # `obj:Option`, used by __getattr__.  It is populated once the
+        # `obj:Configurations` exist, but must be set before anything else can
+        # trigger __getattr__.
+        self._config_cache = {}
+        self._repr_cache = None
+
+        # Whether or not the `obj:Option` has finished configuring - this allows
+        # __getattr__ to skip the configuration checks.
+        self._configured_done = False
+
+        # The user provided hooks (or None if they are not provided) - these
+        # are updated whenever the `obj:Option` is configured.
+        self._validate_fn = None
+        self._validate_with_options_fn = None
+        self._post_process_fn = None
+        self._post_process_with_options_fn = None
+        self._normalize_fn = None
+
+        super(Option, self).__init__(field, parent=parent, **kwargs)
         self.save_initialization_state(**kwargs)
 
+        # The `obj:Configuration` instances themselves do not change when the
+        # `obj:Option` is reconfigured (only their values do), so they can be
+        # cached up front.
+        self._config_cache.update(self.configurations)
+
         self._value = constants.NOTSET
         self._defaulted = False
         self._set = False
 
-        self.create_routine(id="populating")
-        self.create_routine(id="overriding")
-        self.create_routine(id="restoring")
+        # The number of the below routines that are in progress, maintained by
+        # the `obj:OptionRoutine`.
+        self._routines_in_progress = 0
+        self.create_routines(
+            "populating", "overriding", "restoring", cls=OptionRoutine)
+
+        # Store references to the individual routines to avoid looking them up
+        # in the `obj:Routines` each time they are needed.
+        self._populating_routine = self.routines.populating
+        self._overriding_routine = self.routines.overriding
+        self._restoring_routine = self.routines.restoring
+
+        # The routines that, while in progress, defer the validation and post
+        # processing of the `obj:Option` value with the overall `obj:Options`.
+        # The subsection references the same `obj:Routine`(s), so it does not
+        # need to be rebuilt each time the value is set.
+        self._value_routines = self.routines.subsection(
+            ['populating', 'overriding', 'restoring'])
 
     def __lazyinit__(self, **kwargs):
         # Do we really want to do this lazily?  It might hide bugs that are
@@ -234,25 +318,79 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
         super(Option, self).__lazyinit__(**kwargs)
         self.assert_configured()
 
+    def _configure(self, *args, **kwargs):
+        self._configured_done = False
+        super(Option, self)._configure(*args, **kwargs)
+
+        # This has to be done before the configuration is validated, since the
+        # validation of the configuration validates the default value.
+        configurations = self.configurations
+        self._validate_fn = configurations['validate'].value
+        self._validate_with_options_fn = (
+            configurations['validate_with_options'].value)
+        self._post_process_fn = configurations['post_process'].value
+        self._post_process_with_options_fn = (
+            configurations['post_process_with_options'].value)
+        self._normalize_fn = configurations['normalize'].value
+
+        # Nothing else happens in the configuration routine after this point,
+        # so the `obj:Option` is configured as soon as the routine exits.
+        self._configured_done = True
+
     @lazy
     def __deepcopy__(self, memo):
+        # The state of the `obj:Option` is entirely reconstructed from it's
+        # __dict__, so there is no need to run __init__ (and the configuration)
+        # on the copy.
         cls = self.__class__
-        explicit_configuration = deepcopy(
-            self.configurations.explicitly_set_configurations, memo)
-        result = cls.__new__(cls, self.field, **explicit_configuration)
-        result.__init__(self.field, **explicit_configuration)
+        result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            object.__setattr__(result, k, deepcopy(v, memo))
+            if k in _SHALLOW_FIELDS:
+                # These are only replaced with a copy if they are themselves
+                # being copied (i.e. the parent) - otherwise the copy references
+                # the same object.
+                v = memo.get(id(v), v)
+            elif k in _COPIED_FIELDS:
+                v = copy(v)
+            elif type(v) not in ATOMIC_TYPES:
+                v = deepcopy(v, memo)
+            object.__setattr__(result, k, v)
+        return result
+
+    def __copy__(self):
+        """
+        Returns a shallow copy of the `obj:Option` without rerunning the
+        initialization or configuration of the `obj:Option`.
+
+        NOTE:
+        ----
+        The copy shares the `obj:Configurations` and parent of the original
+        `obj:Option`, so mutations to either of those on the copy will be
+        reflected on the original.  If isolation is needed, use deepcopy()
+        instead.  The `obj:Routine`(s) are always copied, so that running a
+        routine on the copy does not alter the state of the original.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        # The copied `obj:Routine`(s) have to reference the copy instead of the
+        # original `obj:Option`.
+        memo = {id(self): result}
+        for k, v in self.__dict__.items():
+            if k in _ROUTINE_FIELDS:
+                v = deepcopy(v, memo)
+            object.__setattr__(result, k, v)
         return result
 
     def __repr__(self):
         # TODO: Come up with state for the option.
         if self.initialized:
-            return "<{cls_name} field={field}>".format(
-                cls_name=self.__class__.__name__,
-                field=self.field,
-            )
+            # The field cannot change after initialization, so the
+            # representation only needs to be built once.
+            if self._repr_cache is None:
+                self._repr_cache = "<%s field=%s>" % (
+                    self.__class__.__name__, self.field)
+            return self._repr_cache
         return "<{cls_name}>".format(cls_name=self.__class__.__name__)
 
     def __getattr__(self, k):
@@ -266,6 +404,15 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
         if k.startswith('_'):
             raise AttributeError("The attribute %s does not exist." % k)
 
+        configuration = self._config_cache.get(k)
+        if configuration is not None:
+            # Every `obj:Configuration` is set when the `obj:Option` finishes
+            # configuring, so the checks are only needed before then.
+            if not self._configured_done:
+                self.assert_configured()
+                configuration.assert_set()
+            return configuration.value
+
         # We want to use the explicit .get_configuration() method because there
         # are cases where an attribute might exist on the `obj:Configurations`
         # but is not a `obj:Configuration`.  We want to restrict the __getattr__
@@ -274,9 +421,14 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
             configuration = self.configurations.get_configuration(k)
         except ConfigurationDoesNotExistError:
             if settings.DEBUG:
-                raise AttributeError("The attribute %s does not exist." % k)
-            six.reraise(*sys.exc_info())
+                six.raise_from(
+                    AttributeError("The attribute %s does not exist." % k),
+                    None
+                )
+            raise
         else:
+            self._config_cache[k] = configuration
+
             # This will only ever be True if we are entering a recursion, which
             # this check blocks.
             # if not self.__lazy_initializing__:
@@ -404,8 +556,11 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
             logger.debug("Overriding already set value.")
 
         # Perform the validation before setting the value on the instance.
+        # When restoring, the value is either the previously populated value or
+        # the default, both of which have already been validated.
         # TODO: Do we want to only validate the value if the value is not EMPTY?
-        self.do_validate(value=value)
+        if not self._restoring_routine.in_progress:
+            self.do_validate(value=value)
 
         # TODO: Double check this logic here.
         # If the `obj:Option` is required, the default is None (since
@@ -419,7 +574,7 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
             assert not self.required  # Is this okay?
             logger.warning(
                 "Setting the value as %s when that is the default, "
-                "this will cause the configuration to be defaulted." % value
+                "this will cause the configuration to be defaulted.", value
             )
             self._defaulted = True
             self._value = constants.EMPTY
@@ -434,34 +589,60 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
 
         self._set = True
 
+        # If the `obj:Option` is populating, overriding or restoring,
+        # validation and post processing routines with options will be run after
+        # the routine finishes.
+        routine_in_progress = self._routines_in_progress != 0
+
         # TODO: We should only trigger this logic if the value has been changed.
         # This requires keeping track of the previous value.
 
         # Note: We also have to check for cases where the default value is
         # explicitly provided!
-        if ((value == constants.EMPTY and self.post_process_on_default is True)
-                or value != constants.EMPTY):
+        post_process = (
+            (value == constants.EMPTY and self.post_process_on_default is True)
+            or value != constants.EMPTY
+        )
+        if post_process:
             self.do_post_process()
-            if not self.routines.subsection(
-                    ['populating', 'overriding', 'restoring']).any('in_progress'):
-                self.do_post_process_with_options()
 
-        # If the `obj:Option` is populating, overriding or restoring,
-        # validation and post processing routines with options will be run after
-        # the routine finishes.
-        if not self.routines.subsection(
-                ['populating', 'overriding', 'restoring']).any('in_progress'):
-            self.do_validate_with_options()
+        if not routine_in_progress:
+            self._do_with_options(post_process=post_process)
 
     def post_routine_with_options(self):
         # TODO: Right now, there is no way for us to tell the difference between
         # an option that was populated or defaulted - this is called from the
         # `obj:Options` routine.  For that reason, it will post_process options
         # that are defaulted - but we're not sure if we want that.
-        if ((self.defaulted and self.post_process_on_default is True)
-                or not self.defaulted):
-            self.do_post_process_with_options()
-        self.do_validate_with_options()
+        self._do_with_options(
+            post_process=not self._defaulted
+            or self.post_process_on_default is True
+        )
+
+    def _do_with_options(self, post_process=True):
+        """
+        Applies the post-processing and validation of the `obj:Option` that
+        reference the parent `obj:Options`.
+
+        This applies the same logic as do_post_process_with_options() and
+        do_validate_with_options(), but resolves the value and parent once
+        for both - and only if either is configured.
+        """
+        post_process = self._post_process_with_options_fn \
+            if post_process else None
+        validate = self._validate_with_options_fn
+        if post_process is None and validate is None:
+            return
+
+        value = self.value
+        parent = self.parent
+        if post_process is not None:
+            post_process(value, self, parent)
+            # The post-processing may have altered the value.
+            value = self.value
+        if validate is not None:
+            self._do_user_provided_validation(
+                value, validate, 'validate_with_options', parent)
 
     def set_default(self, sender=None):
         """
@@ -480,8 +661,8 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
 
     def do_normalize(self, value):
         assert value != constants.EMPTY and value != constants.NOTSET
-        if self.normalize is not None:
-            return self.normalize(value, self.parent)
+        if self._normalize_fn is not None:
+            return self._normalize_fn(value, self.parent)
         return value
 
     @lazy
@@ -502,12 +683,11 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
 
         # We cannot reset the configuration routine because then the option
         # will not be configured anymore.
-        self.routines.subsection(
-            ['populating', 'restoring', 'overriding']).reset()
+        self._value_routines.reset()
 
     @property
     def overridden(self):
-        return self.routines.overriding.finished
+        return self._overriding_routine.finished
 
     @require_set
     def override(self, value):
@@ -529,7 +709,7 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
         if self.set and self.locked:
             self.raise_locked()
 
-        with self.routines.overriding as routine:
+        with self._overriding_routine as routine:
             routine.register(value)
             self.value = value
 
@@ -537,13 +717,12 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
     def populate(self, value, sender=None):
         # Note: The individual `obj:Option` is reset by the parent `obj:Options`
         # on population - so we don't need to do it manually here...
-        from .options import Options
-        if not sender or not isinstance(sender, Options):
+        if not sender or not isinstance(sender, get_option_classes()[1]):
             self.reset()
         # I don't think this assertion is okay, since it means that the default
         # cannot be explicitly provided.
         assert value != self.default  # Is this okay?
-        with self.routines.populating as routine:
+        with self._populating_routine as routine:
             routine.register(value)
             self.value = value
 
@@ -565,29 +744,64 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
         if not self.overridden:
             logger.debug(
                 "The option %s has not been overridden and thus cannot be "
-                "restored." % self.field
+                "restored.", self.field
             )
+            return
 
-        with self.routines.restoring:
+        with self._restoring_routine:
             # The populating history can still be 0 if the default was
             # originally set when  populating but the default value was
             # overridden - hence no populated value.
             # To restore, we have to set back to it's default...
             # TODO: There should be a better way of doing this, we should
             # just keep track of the  value it was initially set to.
-            assert len(self.routines.populating.history) in (0, 1)
-            if len(self.routines.populating.history) == 0:
+            history = self._populating_routine.history
+            num_populated = len(history)
+            assert num_populated in (0, 1)
+            if num_populated == 0:
                 logger.debug(
                     "The option %s was overridden but never populated - "
                     "it's default value was used.  Restoring it's value "
-                    "back to that default." % self.field
+                    "back to that default.", self.field
                 )
                 assert not self.required
                 self.set_default(sender=self)
             else:
-                # Note: This is going to trigger redundant validation of the
-                # value, but that is not a big deal.
-                self.value = self.routines.populating.history[0]
+                # Note: The value is not revalidated, since it was validated
+                # when it was populated.
+                self.value = history[0]
+
+    @require_set
+    def snapshot(self):
+        """
+        Returns the raw value of the `obj:Option` along with the state of it's
+        overriding and restoring `obj:Routine`(s), so that the `obj:Option`
+        can later be reverted back to that state with revert().
+
+        The value is stored before it is normalized, so that reverting the
+        `obj:Option` does not apply the normalization a second time.
+        """
+        return (
+            self._value,
+            self._overriding_routine.snapshot(),
+            self._restoring_routine.snapshot(),
+        )
+
+    @require_set
+    def revert(self, snapshot):
+        """
+        Reverts the `obj:Option` back to the state of the provided snapshot,
+        which is taken with snapshot().
+
+        The value is set in the context of the restoring routine, so it is not
+        revalidated (it was validated when it was originally set) but it is
+        post-processed.
+        """
+        value, overriding, restoring = snapshot
+        with self._restoring_routine:
+            self.value = value
+        self._overriding_routine.revert(overriding)
+        self._restoring_routine.revert(restoring)
 
     # We cannot require populated or populating because this will be applied
     # in some cases for defaulted options.
@@ -610,8 +824,8 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
         but instead is immediately called when the `obj:Option` finishes
         populating, overriding or restoring.
         """
-        if self.post_process is not None:
-            self.post_process(self.value, self)
+        if self._post_process_fn is not None:
+            self._post_process_fn(self.value, self)
 
     # We cannot require populated or populating because this will be applied
     # in some cases for defaulted options.
@@ -653,18 +867,19 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
           capability in, so the methods have more context about what routine they
           are being called in association with.
         """
-        if self.post_process_with_options is not None:
-            self.post_process_with_options(self.value, self, self.parent)
+        if self._post_process_with_options_fn is not None:
+            self._post_process_with_options_fn(self.value, self, self.parent)
 
     # NOTE: Here we can probably get away with not accumulating the errors but
     # just raising them, since only one error will ever accumulate.
-    @require_configured
+    # NOTE: This is not decorated with @require_configured because it is only
+    # ever called from methods that already require the `obj:Option` to be
+    # configured.
     @accumulate_errors(error_cls='invalid_error', name='field')
     def _do_user_provided_validation(self, value, func, name, *args):
         """
         Applies the user provided validation method to the `obj:Option`.
         """
-        configuration = self.configurations[name]
         try:
             # NOTE: This accounts for the default value and the value after
             # normalization.  This might be overkill if the value was defaulted,
@@ -675,7 +890,7 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
             # TODO: Maybe we should lax this requirement.  The caveat is that
             # other exceptions could be swallowed and a misleading configuration
             # related exception would disguise them.
-            if isinstance(e, (OptionsInvalidError, OptionInvalidError)):
+            if type(e) in _RAISE_TYPES or isinstance(e, _RAISE_TYPES):
                 # NOTE: This logic breaks apart if the default value was altered
                 # by the normalization.  We should also check the normalized
                 # default value in the configuration validation.
@@ -688,7 +903,7 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
                 e.value = value
                 yield e
             else:
-                yield configuration.raise_invalid(
+                yield self.configurations[name].raise_invalid(
                     return_exception=True,
                     children=[e],
                     message=(
@@ -700,14 +915,14 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
                     )
                 )
         else:
-            if isinstance(result, six.string_types):
+            if type(result) is str or isinstance(result, _STR_TYPES):
                 yield self.raise_invalid(
                     return_exception=True,
                     value=value,
                     message=result
                 )
             elif result is not None:
-                yield configuration.raise_invalid(
+                yield self.configurations[name].raise_invalid(
                     return_exception=True,
                     message=(
                         "The option validate method must return a string error "
@@ -764,11 +979,11 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
         """
         # TODO: Should we call the `obj:Options` parent validation routine?
         # In the case that the `obj:Option` is instantiated individually?
-        value = value or self.value
-        if self.validate_with_options is not None:
+        if self._validate_with_options_fn is not None:
+            value = self.value if value is None else value
             self._do_user_provided_validation(
                 value,
-                self.validate_with_options,
+                self._validate_with_options_fn,
                 'validate_with_options',
                 self.parent
             )
@@ -851,11 +1066,11 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
         # TODO: Since the default and normalized default are already checked in
         # the configuration validation, should we only perform validation here
         # if the value is not EMPTY?
-        if self.validate is not None:
+        if self._validate_fn is not None:
             # TODO: Should we be transforming this in some way instead of just
             # appending the children?
             yield self._do_user_provided_validation(
-                value, self.validate, 'validate', return_children=True)
+                value, self._validate_fn, 'validate', return_children=True)
 
     @require_configured
     @accumulate_errors(error_cls='invalid_error', name='field')
@@ -891,11 +1106,11 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
                     and not VALIDATE_NORMALIZED_VALUE_IF_ORIGINAL_INVALID):
                 return
 
-            # Validate the normalized value if it is applicable.
-            if self.normalize is not None:
-                # TODO: In the case that the value is defaulted, the normalized
-                # default will have already been validated in the configuration
-                # validation, so maybe we should skip that condition?
+            # Validate the normalized value if it is applicable.  In the case
+            # that the value is defaulted (EMPTY), the normalized default will
+            # have already been validated in the configuration validation.
+            if (self._normalize_fn is not None
+                    and value != constants.EMPTY):
                 normalized_value = self.do_normalize(value)
                 if normalized_value != value or VALIDATE_NORMALIZED_VALUE_IF_SAME:
                     # TODO: Maybe we should wrap this in some kind of different
@@ -923,14 +1138,16 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
         individual configuration values are altered, but not when the\
         `obj:Option` value is changed..
         """
+        default_configuration = self.configurations['default']
+        default_provided = self.default_provided
+
         # Validate that the default is not provided in the case that the value
         # is required.
         if self.required is True:
             # TODO: Do we really want to raise an exception here?  Maybe we should
             # just log a warning?
-            if self.default_provided:
-                configuration = self.configurations['default']
-                yield configuration.raise_invalid(
+            if default_provided:
+                yield default_configuration.raise_invalid(
                     return_exception=True,
                     message=(
                         "Cannot provide a default value for option "
@@ -940,29 +1157,26 @@ class Option(ConfigurationsConfigurableChild, PopulatingMixin):
         else:
             # If the value is not required, issue a warning if the default is not
             # explicitly provided.
-            if not self.default_provided:
+            if not default_provided:
                 logger.warning(
                     "The option for `%s` is not required and no default "
-                    "value is specified. The default value will be `None`."
-                    % self.field
+                    "value is specified. The default value will be `None`.",
+                    self.field
                 )
 
             # Note: This will also validate the default normalized value.
-            errors = self.do_validate(
-                value=self.default,
-                return_children=True
-            )
+            default = self.default
+            errors = self.do_validate(value=default, return_children=True)
             if errors:
                 # TODO: Right now this will display the error as an Invalid Option
                 # nested under an Invalid Configuration Error.  The Invalid Option
                 # is slightly misleading because it indicates that the option
                 # value is invalid, instead of the fact that that the
                 # configuration value does not conform to the option specs.
-                configuration = self.configurations['default']
-                yield configuration.raise_invalid(
+                yield default_configuration.raise_invalid(
                     return_exception=True,
                     children=errors,
-                    value=self.default,
+                    value=default,
                     detail=(
                         "If providing a default value, the default value must "
                         "also conform to the configuration specifications on "
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 import functools
 import logging
 import six
@@ -11,11 +11,12 @@ from pickyoptions.core.configuration import (
     Configuration, Configurations, ConfigurationsConfigurableParent)
 from pickyoptions.core.configuration.configuration_lib import (
     CallableConfiguration)
+from pickyoptions.core.configuration.utils import lazy_configurations
 from pickyoptions.core.routine import Routine
 from pickyoptions.core.routine.routine import (
     require_not_in_progress, require_finished)
 
-from .constants import OptionsState
+from .constants import ATOMIC_TYPES, OptionsState
 from .exceptions import (
     OptionsInvalidError,
     OptionsNotConfiguredError,
@@ -34,6 +35,26 @@ from .utils import require_populated
 logger = logging.getLogger(settings.PACKAGE_NAME)
 
 
+# Error message shared by the `obj:CallableConfiguration`(s) of the
+# `obj:Options`.
+_ERR_1ARG = sys.intern(
+    "Must be a callable that takes the options instance as it's first and "
+    "only argument."
+)
+
+# Attributes of the `obj:Options` that can be mutated but only contain values
+# that do not need to be copied (i.e. the mapping of error names to exception
+# classes), so a shallow copy is sufficient.
+_COPIED_FIELDS = frozenset(['errors'])
+
+# Attributes of the `obj:Options` that are never mutated (i.e. the fields of the
+# `obj:Configuration`(s) and the user provided callables), so the copy can
+# reference the same objects.
+_SHARED_FIELDS = frozenset([
+    '_configuration_fields', '_child_value', '_validate_fn',
+    '_post_process_fn'])
+
+
 class OptionsRoutine(Routine):
     @require_not_in_progress
     def clear_queue(self):
@@ -73,8 +94,7 @@ class OptionsRoutine(Routine):
         triggered to perform their own post population routines.
         """
         super(OptionsRoutine, self).post_routine(instance)
-        instance.do_validate()
-        instance.do_post_process()
+        instance.do_validate_and_post_process()
 
 
 # TODO: Allow Options to be initialized as lazy=True or lazy=False.
@@ -129,6 +149,10 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
     # Parent Implementation Properties
     child_cls = Option
 
+    # Exceptions that a user provided validation method can raise to indicate
+    # that the `obj:Options` are invalid.
+    validation_errors = (OptionsInvalidError, OptionInvalidError)
+
     errors = {
         # Child Implementation Properties
         'does_not_exist_error': OptionDoesNotExistError,
@@ -141,38 +165,45 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
         'populated_error': OptionsPopulatedError,
     }
 
-    # TODO: We should consider moving this inside the instance, because it might
-    # be causing code to be run unnecessarily on import.
-    configurations = Configurations(
-        CallableConfiguration(
-            'post_process',
-            num_arguments=1,
-            error_message=(
-                "Must be a callable that takes the options instance as "
-                "it's first and only argument."
-            )
-        ),
-        CallableConfiguration(
-            'validate',
-            num_arguments=1,
-            error_message=(
-                "Must be a callable that takes the options instance as "
-                "it's first and only argument."
-            )
-        ),
-        Configuration('strict', default=False, types=(bool, )),
-        # TOOD: Change this!
-        validation_error=OptionsInvalidError,
-    )
+    # The `obj:Configurations` are built the first time an `obj:Options`
+    # instance is created, so that importing the package does not run the
+    # configuration code.
+    @lazy_configurations
+    def configurations(cls):
+        return Configurations(
+            CallableConfiguration(
+                'post_process',
+                num_arguments=1,
+                error_message=_ERR_1ARG
+            ),
+            CallableConfiguration(
+                'validate',
+                num_arguments=1,
+                error_message=_ERR_1ARG
+            ),
+            Configuration('strict', default=False, types=(bool, )),
+            # TOOD: Change this!
+            validation_error=OptionsInvalidError,
+        )
 
     def __init__(self, *args, **kwargs):
         self._state = OptionsState.NOT_INITIALIZED
+        # The user provided `validate` and `post_process` configuration values,
+        # stored when the `obj:Options` are configured so that they do not need
+        # to be looked up in the `obj:Configurations` each time the
+        # `obj:Options` change.
+        self._validate_fn = None
+        self._post_process_fn = None
         # TODO: Should we include the validate_configuration method?
         super(Options, self).__init__(
             children=list(args),
             child_value=lambda child: child.value,
             **kwargs
         )
+        # The fields of the `obj:Configuration`(s) are fixed, so they are
+        # stored to quickly determine whether an attribute refers to a
+        # `obj:Configuration` or an `obj:Option`.
+        self._configuration_fields = frozenset(self.configurations.fields)
         self.create_routine(
             id="populating",
             cls=OptionsRoutine,
@@ -189,19 +220,47 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
             cls=OptionsRoutine,
             post_routine=self.post_restore
         )
+        # Store a reference to the populating routine to avoid looking it up in
+        # the `obj:Routines` each time it is needed.
+        self._populating_routine = self.routines.populating
 
     def __postinit__(self, *args, **kwargs):
         self._state = OptionsState.NOT_POPULATED
 
+    def _configure(self, *args, **kwargs):
+        super(Options, self)._configure(*args, **kwargs)
+        self._store_configured_fns()
+
+    def _store_configured_fns(self):
+        self._validate_fn = self.configurations['validate'].value
+        self._post_process_fn = self.configurations['post_process'].value
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         result = cls.__new__(
             cls, **self.configurations.explicitly_set_configuration_values)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            object.__setattr__(result, k, deepcopy(v, memo))
+            if k in _SHARED_FIELDS:
+                pass
+            elif k in _COPIED_FIELDS:
+                v = copy(v)
+            elif k == '_children':
+                v = [self._deepcopy_option(option, memo) for option in v]
+            elif type(v) not in ATOMIC_TYPES:
+                v = deepcopy(v, memo)
+            object.__setattr__(result, k, v)
         return result
 
+    @staticmethod
+    def _deepcopy_option(option, memo):
+        # The `obj:Option` implements it's own __deepcopy__, so it is called
+        # directly instead of dispatching through deepcopy().
+        copied = memo.get(id(option))
+        if copied is None:
+            copied = option.__deepcopy__(memo)
+        return copied
+
     def __call__(self, *args, **kwargs):
         self.populate(*args, **kwargs)
 
@@ -210,14 +269,14 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
             if self.populated:
                 return super(Options, self).__repr__(
                     state=self.state,
-                    params=", ".join([
-                        "{k}={v}".format(k=k, v=v)
-                        for k, v in self.zipped
-                    ])
+                    params=", ".join(
+                        "%s=%s" % (option.field, option.value)
+                        for option in self.children
+                    )
                 )
             return super(Options, self).__repr__(
                 state=self.state,
-                options=", ".join([option.field for option in self.children])
+                options=", ".join(option.field for option in self.children)
             )
         return super(Options, self).__repr__(state=self.state)
 
@@ -226,7 +285,7 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
             raise AttributeError("The attribute %s does not exist." % k)
 
         # First check if the value is a configuration.
-        if self.configurations.has_child(k):
+        if k in self._configuration_fields:
             self.assert_configured()
             configuration = self.configurations.get_configuration(k)
             return configuration.value
@@ -243,15 +302,15 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
             # if they are already configured.
             self.assert_configured()
             self.configurations.assert_configured()
-            if self.configurations.has_child(k):
+            if k in self._configuration_fields:
                 configuration = self.configurations[k]
                 configuration.assert_configured()
                 setattr(self.configurations, k, v)
+                self._store_configured_fns()
             else:
                 option = self.get_child(k)
                 option.value = v
-                self.do_validate()
-                self.do_post_process()
+                self.do_validate_and_post_process()
 
     @property
     def state(self):
@@ -262,7 +321,7 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
         # Note: We have to use did_run here because the options can be overridden
         # after they were already overridden, in which case the state will be
         # IN_PROGRESS and then FINISHED.
-        if self.routines.populating.did_run:
+        if self._populating_routine.did_run:
             assert self.state != OptionsState.POPULATED_NOT_OVERRIDDEN
         return self.routines.overriding.did_run
 
@@ -314,14 +373,17 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
         data = dict(*args, **kwargs)
 
         # Make sure that no invalid options provided.
-        for k, _ in data.items():
-            self.raise_if_child_missing(k)
+        self.raise_if_children_missing(data)
 
-        with self.routines.populating as routine:
+        # Sentinel for options that are not provided, since None is a valid
+        # value to populate an option with.
+        missing = object()
+        with self._populating_routine as routine:
             for option in self.options:
                 option.assert_configured()
-                if option.field in data:
-                    option.populate(data[option.field])
+                value = data.get(option.field, missing)
+                if value is not missing:
+                    option.populate(value)
                     # Keep track of the options that were explicitly populated so
                     # they can be used to reset the `obj:Options` to it's
                     # previously populated state at a later point in time.
@@ -354,8 +416,7 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
         data = dict(*args, **kwargs)
 
         # Make sure that no invalid options provided.
-        for k, _ in data.items():
-            self.raise_if_child_missing(k)
+        self.raise_if_children_missing(data)
 
         # Note: We do not reset the overriding routine because it needs to track
         # consecutively run overrides.
@@ -379,8 +440,7 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
             OptionsState.POPULATED_OVERRIDDEN
         )
         self._state = OptionsState.POPULATED_OVERRIDDEN
-        self.do_validate()
-        self.do_post_process()
+        self.do_validate_and_post_process()
 
     def clear_override(self):
         raise NotImplementedError()
@@ -520,22 +580,25 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
         returned value is not `None` and the validate method does not comform
         to the (4) protocols above, an exception will be raised.
         """
-        configuration = self.configurations['validate']
-        configuration.assert_set()
-        if configuration.value is not None:
+        self._do_validate()
+
+    def _do_validate(self):
+        # The routine state is checked by the callers, so that it is not
+        # checked more than once when validating and post-processing together.
+        if self._validate_fn is not None:
             logger.debug("Validating overall options.")
             try:
-                result = configuration.value(self)
+                result = self._validate_fn(self)
             except Exception as e:
                 # This is very problematic, because we can't tell the difference
                 # between actual errors and errors that were intentionally raised.
                 # We should fix this...
-                if isinstance(e, (OptionsInvalidError, OptionInvalidError)):
-                    six.reraise(*sys.exc_info())
+                if isinstance(e, self.validation_errors):
+                    raise
                 else:
                     if settings.DEBUG:
-                        six.reraise(*sys.exc_info())
-                    configuration.raise_invalid(
+                        raise
+                    self.configurations['validate'].raise_invalid(
                         message=(
                             "If raising an exception to indicate that the "
                             "options are invalid, the exception must be an "
@@ -548,7 +611,7 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
             else:
                 if result is not None:
                     if not isinstance(result, six.string_types):
-                        configuration.raise_invalid(
+                        self.configurations['validate'].raise_invalid(
                             message=(
                                 "The option validate method must return a "
                                 "string error message, raise an instance of "
@@ -560,6 +623,18 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
                         )
                     self.raise_invalid(message=result)
 
+    @require_finished(id='populating')
+    def do_validate_and_post_process(self):
+        """
+        Validates and then post-processes the overall `obj:Options` instance,
+        which is done whenever the `obj:Options` change.
+
+        Neither step is dispatched if the user did not provide the associated
+        `validate` or `post_process` configuration, which is the common case.
+        """
+        self._do_validate()
+        self._do_post_process()
+
     @require_finished(id='populating')
     def do_post_process(self, children=None):
         """
@@ -587,9 +662,14 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
         argument, the `obj:Option` instance as their second argument and the
         populated `obj:Options` instance as their third argument.
         """
-        if self.post_process is not None:
+        self._do_post_process()
+
+    def _do_post_process(self):
+        # The routine state is checked by the callers, so that it is not
+        # checked more than once when validating and post-processing together.
+        if self._post_process_fn is not None:
             logger.debug("Post processing options")
-            self.post_process(self)
+            self._post_process_fn(self)
 
     @require_finished(id='populating')
     def local_override(self, func):
@@ -617,27 +697,52 @@ class Options(ConfigurationsConfigurableParent, PopulatingMixin):
         >>> get_host_name(8000, HOST_NAME="123.123.123.123")
         >>> "123.123.123.123:8000"
         """
+        # The mapping of option fields is maintained as the `obj:Option`(s)
+        # change, so it can be bound once here instead of being rebuilt on each
+        # call.
+        fields = self._children_by_field
+
         @functools.wraps(func)
         def inner(*args, **kwargs):
-            local_options = {}
-            option_overrides = kwargs.get('options', kwargs)
-            for k, v in option_overrides.items():
-                if k in self.option_fields:
-                    local_options[k] = kwargs.pop(k)
-
-            # Store current options before the local override in memory, so they
-            # can be used after the function returns to reset the `obj:Options`
-            # instance.
-            current_options = deepcopy(self.__dict__)
+            # The overrides can either be provided explicitly as a dict, via the
+            # `options` keyword argument, or mixed in with the keyword arguments
+            # for the decorated method - in which case they have to be removed
+            # from the keyword arguments passed through to the method.
+            option_overrides = kwargs.pop('options', None)
+            if option_overrides is not None:
+                local_options = dict(
+                    (k, v) for k, v in option_overrides.items() if k in fields)
+            else:
+                local_options = dict(
+                    (k, kwargs.pop(k)) for k in list(kwargs) if k in fields)
+
+            # Store the state of the `obj:Option`(s) that are overridden and of
+            # the routines that the override affects, so that the `obj:Options`
+            # can be reverted back to the state they were in before the method
+            # was called - including any overrides that were previously applied.
+            overridden = [fields[k] for k in local_options]
+            snapshots = [option.snapshot() for option in overridden]
+            state = self._state
+            overriding_snapshot = self.routines.overriding.snapshot()
+            restoring_snapshot = self.routines.restoring.snapshot()
 
             # Apply overrides and allow the method to run with the overrides
             # applied.
             self.override(local_options)
             result = func(*args, **kwargs)
 
-            # Wipe out the locally scoped overrides and reset the state back to
-            # what it was before the method was called.
-            self.populate(current_options)
+            # Wipe out the locally scoped overrides by reverting the overridden
+            # `obj:Option`(s) in the context of the restoring routine, so they
+            # are post-processed and validated with the `obj:Options` the same
+            # way they would be when restoring.
+            with self.routines.restoring as routine:
+                for option, snapshot in zip(overridden, snapshots):
+                    option.revert(snapshot)
+                    routine.add_to_queue(option)
+
+            self._state = state
+            self.routines.overriding.revert(overriding_snapshot)
+            self.routines.restoring.revert(restoring_snapshot)
             return result
 
         return inner
@@ -1,6 +1,21 @@
 import functools
 
 
+# The `obj:Option` and `obj:Options` classes cannot be imported at the module
+# level because of circular imports, so they are imported the first time they
+# are needed.
+_option_classes = None
+
+
+def get_option_classes():
+    global _option_classes
+    if _option_classes is None:
+        from pickyoptions.core.options.option import Option
+        from pickyoptions.core.options.options import Options
+        _option_classes = (Option, Options)
+    return _option_classes
+
+
 def require_populated(func):
     """
     Decorator to ensure that the instance is populated before proceeding.
@@ -10,10 +25,7 @@ def require_populated(func):
     """
     @functools.wraps(func)
     def inner(instance, *args, **kwargs):
-        from pickyoptions.core.options.option import Option
-        from pickyoptions.core.options.options import Options
-
-        assert isinstance(instance, (Option, Options))
+        assert isinstance(instance, get_option_classes())
         if not instance.populated:
             instance.raise_not_populated()
         return func(instance, *args, **kwargs)
@@ -30,10 +42,7 @@ def require_populating_or_populated(func):
     """
     @functools.wraps(func)
     def inner(instance, *args, **kwargs):
-        from pickyoptions.core.options.option import Option
-        from pickyoptions.core.options.options import Options
-
-        assert isinstance(instance, (Option, Options))
+        assert isinstance(instance, get_option_classes())
         if not instance.populated and not instance.populating:
             instance.raise_not_populated_or_populating()
         return func(instance, *args, **kwargs)
@@ -54,10 +63,7 @@ def require_populated_property(func):
     """
     @property
     def inner(instance):
-        from pickyoptions.core.options.option import Option
-        from pickyoptions.core.options.options import Options
-
-        assert isinstance(instance, (Option, Options))
+        assert isinstance(instance, get_option_classes())
         if not instance.populated:
             instance.raise_not_populated()
         return func(instance)
@@ -27,11 +27,21 @@ class Routine(Base):
         self._state = RoutineState.NOT_STARTED
         self._history = []
         self._queue = []
+        # The ids of the elements in the queue, used to check that an element
+        # is not queued twice without scanning the queue.
+        self._queued_ids = set()
         self._pre_routine = pre_routine
         self._post_routine = post_routine
         self._on_queue_removal = on_queue_removal
         self._consecutive_runs = consecutive_runs
 
+    def __deepcopy__(self, memo):
+        result = super(Routine, self).__deepcopy__(memo)
+        # The copied queue holds different elements than the original, so the
+        # ids of the queued elements have to be rebuilt from it.
+        result._queued_ids = set([id(obj) for obj in result._queue])
+        return result
+
     def __enter__(self):
         # Prevent multiple runs of the same routine if it is not allowed.
         if self.did_run and not self._consecutive_runs:
@@ -163,11 +173,16 @@ class Routine(Base):
         """
         Adds an operated element the `obj:Routine`'s progress queue.
         """
-        assert obj not in self._queue
+        if id(obj) in self._queued_ids:
+            raise RoutineError(
+                "The element %s is already in the %s queue." % (obj, self.id))
+        self._queued_ids.add(id(obj))
         self._queue.append(obj)
 
     def save(self):
-        self._history.append(self._queue)
+        # The queue is cleared in place when the routine finishes, so the
+        # history has to store a copy of it.
+        self._history.append(list(self._queue))
 
     @require_finished
     def clear_queue(self):
@@ -181,13 +196,16 @@ class Routine(Base):
         if self._on_queue_removal:
             for obj in self.queue:
                 self._on_queue_removal(obj)
-        self._queue = []
+        # The containers are cleared in place, rather than replaced, so they can
+        # be reused by the next run of the routine.
+        self._queue.clear()
+        self._queued_ids.clear()
 
     @require_not_in_progress
     def clear_history(self):
         logger.debug(
             "Clearing %s items from the history queue." % len(self._history))
-        self._history = []
+        self._history.clear()
 
     def reset(self):
         """
@@ -197,6 +215,25 @@ class Routine(Base):
         self.clear_history()
         self._state = RoutineState.NOT_STARTED
 
+    @require_not_in_progress
+    def snapshot(self):
+        """
+        Returns the state and history of the `obj:Routine`, so that the
+        `obj:Routine` can later be reverted back to them with revert().
+        """
+        assert len(self._queue) == 0
+        return self._state, list(self._history)
+
+    @require_not_in_progress
+    def revert(self, snapshot):
+        """
+        Reverts the `obj:Routine` back to the state and history of the provided
+        snapshot, which is taken with snapshot().
+        """
+        assert len(self._queue) == 0
+        self._state, history = snapshot
+        self._history[:] = history
+
     def store(self, value):
         """
         Adds an operated element the `obj:Routine`'s history.
@@ -30,6 +30,16 @@ class Routines(list):
         assert routine.id not in [rout.id for rout in self]
         super(Routines, self).append(routine)
 
+    def extend(self, routines):
+        # TODO: Come up with better errors here.
+        routines = list(routines)
+        assert all([isinstance(routine, Routine) for routine in routines])
+        ids = set([rout.id for rout in self])
+        for routine in routines:
+            assert routine.id not in ids
+            ids.add(routine.id)
+        super(Routines, self).extend(routines)
+
     def subsection(self, ids):
         # Note: The individual routines are not __deepcopy__'d, so they may
         # be mutated in the subsections and the mutations will apply to the
@@ -38,10 +48,10 @@ class Routines(list):
         return self.__class__(*tuple(subroutines))
 
     def get_routine(self, id):
-        try:
-            return [routine for routine in self if routine.id == id][0]
-        except IndexError:
-            raise RoutineDoesNotExistError(id=id)
+        for routine in self:
+            if routine.id == id:
+                return routine
+        raise RoutineDoesNotExistError(id=id)
 
     def clear_queues(self):
         for routine in self:
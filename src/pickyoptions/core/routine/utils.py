@@ -3,6 +3,19 @@ import functools
 from pickyoptions.lib.utils import optional_parameter_decorator
 
 
+# The `obj:Routine` class cannot be imported at the module level because of
+# circular imports, so it is imported the first time it is needed.
+_routine_cls = None
+
+
+def get_routine_cls():
+    global _routine_cls
+    if _routine_cls is None:
+        from pickyoptions.core.routine import Routine
+        _routine_cls = Routine
+    return _routine_cls
+
+
 @optional_parameter_decorator
 def require_not_in_progress(func, id=None):
     """
@@ -15,9 +28,7 @@ def require_not_in_progress(func, id=None):
     """
     @functools.wraps(func)
     def inner(instance, *args, **kwargs):
-        from pickyoptions.core.routine import Routine
-
-        if isinstance(instance, Routine):
+        if isinstance(instance, get_routine_cls()):
             routine = instance
         else:
             routine = getattr(instance.routines, id)
@@ -40,9 +51,7 @@ def require_finished(func, id=None):
     """
     @functools.wraps(func)
     def inner(instance, *args, **kwargs):
-        from pickyoptions.core.routine import Routine
-
-        if isinstance(instance, Routine):
+        if isinstance(instance, get_routine_cls()):
             routine = instance
         else:
             routine = getattr(instance.routines, id)
@@ -1,10 +1,19 @@
-from pickyoptions.lib.utils import classlookup
 from .exceptions import PickyOptionsError
 
 
+# Error classes that have already been validated, so that the validation does
+# not have to be repeated each time an error is raised.
+_VALIDATED_ERROR_CLASSES = set()
+
+
 def validate_is_picky_options_error_class(error_cls):
-    bases = classlookup(error_cls)
-    if PickyOptionsError not in bases:
+    if error_cls in _VALIDATED_ERROR_CLASSES:
+        return
+    # The MRO contains every base of the class exactly once, whereas walking
+    # the __bases__ recursively revisits the shared bases of the (heavily
+    # multiply inherited) exception classes.
+    if PickyOptionsError not in error_cls.__mro__[1:]:
         raise ValueError(
             "The provided error must be an instance of PickyOptionsError."
         )
+    _VALIDATED_ERROR_CLASSES.add(error_cls)
@@ -1,7 +1,10 @@
+from copy import deepcopy
 import pytest
 
 from pickyoptions.core.base import Base
 from pickyoptions.core.exceptions import PickyOptionsError
+from pickyoptions.core.routine import Routine
+from pickyoptions.core.routine.exceptions import RoutineError
 
 
 def test_abstract_properties_inherit():
@@ -96,3 +99,22 @@ def test_required_errors_merge():
 
     assert Child1.required_errors == Parent2.required_errors == ('foo', 'bar')
     assert set(Child2.required_errors) == set(('apple', 'banana', 'bar', 'foo'))
+
+
+def test_deepcopy_routine_queue():
+    class Element(object):
+        pass
+
+    routine = Routine(None, 'populating')
+    element = Element()
+    with routine:
+        routine.add_to_queue(element)
+        copied = deepcopy(routine)
+        # The copied queue holds a copy of the element, so the copy has to
+        # track the copied element instead of the original one.
+        copied_element = copied.queue[0]
+        assert copied_element is not element
+        with pytest.raises(RoutineError):
+            copied.add_to_queue(copied_element)
+        copied.add_to_queue(element)
+        assert copied.queue == [copied_element, element]
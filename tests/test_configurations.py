@@ -1,6 +1,6 @@
 import pytest
 
-from pickyoptions.core.configuration import Configuration
+from pickyoptions.core.configuration import Configuration, Configurations
 from pickyoptions.core.configuration.configuration_lib import TypesConfiguration
 from pickyoptions.core.configuration.exceptions import ConfigurationError
 
@@ -31,3 +31,19 @@ def test_configuration_required_default_provided():
             required=True,
             default='default_field'
         )
+
+
+def test_configurations_explicitly_set():
+    configurations = Configurations(
+        Configuration('color', default='red'),
+        Configuration('width', default=0, types=(int, )),
+    )
+    configurations.configure(width=5)
+    assert set(configurations.explicitly_set_configurations) == {'width'}
+    with pytest.raises(TypeError):
+        configurations.explicitly_set_configurations['color'] = None
+    assert configurations.explicitly_set_configuration_values == {'width': 5}
+
+    configurations.configure(color='blue')
+    assert configurations.explicitly_set_configuration_values == {
+        'color': 'blue'}
@@ -1,4 +1,8 @@
-from pickyoptions.core.exceptions import PickyOptionsError, ValueTypeError
+import copy
+
+from pickyoptions.core.exceptions import (
+    PickyOptionsError, ValueTypeError, format_template,
+    get_template_placeholders)
 from pickyoptions.core.options.exceptions import OptionTypeError
 
 
@@ -110,3 +114,39 @@ def test_transform_error():
     print(e2)
     return
     assert str(e2) == "\nInvalid Value Type: This is a test message."
+
+
+def test_template_placeholders():
+    assert get_template_placeholders("The {name} must be {types}.") == \
+        frozenset(['name', 'types'])
+    assert get_template_placeholders("There was an error.") == frozenset()
+
+
+def test_message_updated_after_injection_changes():
+    exc = PickyOptionsError("The {field} is invalid.", field="test-field")
+    assert exc.message == "The test-field is invalid."
+    exc.field = "other-field"
+    assert exc.message == "The other-field is invalid."
+
+
+def test_format_template():
+    assert format_template("The {name} is {value}.", {
+        'name': 'field', 'value': 1}) == "The field is 1."
+    assert format_template("The {name} is {value}.", {
+        'name': 'field', 'value': True}) == "The field is True."
+    assert format_template("The {name} is {value}.", {
+        'name': 'field', 'value': [1]}) == "The field is [1]."
+    assert format_template("There was an error.", {
+        'name': 'field'}) == "There was an error."
+
+
+def test_copy_error():
+    try:
+        raise PickyOptionsError("The {field} is invalid.", field="test-field")
+    except PickyOptionsError as e:
+        exc = e
+    copied = copy.copy(exc)
+    assert copied.__traceback__ is None
+    assert copied.message == exc.message
+    copied.field = "other-field"
+    assert exc.field == "test-field"
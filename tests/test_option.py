@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 import pytest
 
 from pickyoptions import Option, Options
@@ -48,6 +48,63 @@ def test_deepcopy_option():
     assert new_option.types == (int, float)
     assert new_option.routines.populating.finished is True
     assert new_option.value == 1.0
+    assert new_option.parent is options
+    assert new_option.errors == option.errors
+    assert new_option.errors is not option.errors
+
+
+def test_deepcopy_option_does_not_reconfigure(monkeypatch):
+    options = Options(
+        Option('width', required=False, default=0.0, types=(int, float))
+    )
+    options.populate(width=1.0)
+    option = options.options[0]
+
+    def configure(*args, **kwargs):
+        raise AssertionError("The option should not be reconfigured.")
+
+    monkeypatch.setattr(Option, 'configure', configure)
+    new_option = deepcopy(option)
+
+    assert new_option.configured
+    assert new_option.configurations is not option.configurations
+    assert new_option.value == 1.0
+
+
+def test_deepcopy_options_copies_option_parent():
+    options = Options(
+        Option('width', required=False, default=0.0, types=(int, float))
+    )
+    options.populate(width=1.0)
+    new_options = deepcopy(options)
+    new_option = new_options.options[0]
+
+    assert new_option is not options.options[0]
+    assert new_option.parent is new_options
+
+
+def test_copy_option():
+    options = Options(
+        Option('width', required=False, default=0.0, types=(int, float))
+    )
+    options.populate(width=1.0)
+    option = options.options[0]
+    new_option = copy(option)
+
+    assert new_option is not option
+    assert new_option.field == 'width'
+    assert new_option.configurations is option.configurations
+    assert new_option.parent is options
+    assert new_option.value == 1.0
+
+    # The routines are not shared with the original option.
+    assert new_option.routines is not option.routines
+    assert new_option._populating_routine is new_option.routines.populating
+    new_option.override(2.0)
+    assert new_option.overridden is True
+    assert new_option._routines_in_progress == 0
+    assert option.overridden is False
+    assert option.value == 1.0
 
 
 def test_option_default_not_of_type():
@@ -57,3 +114,27 @@ def test_option_default_not_of_type():
         )
         # We have to populate because the configuration validation is lazy.
         options.populate()
+
+
+def test_set_option_value_post_process_with_options_after_post_process():
+    # The normalized value depends on how many times the option has been
+    # post-processed, so the post-processing with options has to see the value
+    # after the post-processing - both when populating and when setting.
+    post_processed = []
+    seen = []
+
+    options = Options(Option(
+        'width',
+        default=0.0,
+        normalize=lambda value, option: value + len(post_processed),
+        post_process=lambda value, option: post_processed.append(value),
+        post_process_with_options=lambda value, option, options: seen.append(
+            value),
+    ))
+    options.populate(width=1.0)
+    assert seen == [2.0]
+
+    option = options.get_option('width')
+    option.value = 2.0
+    assert post_processed == [1.0, 3.0]
+    assert seen == [2.0, 4.0]
@@ -1,13 +1,25 @@
+from copy import deepcopy
 import pytest
 
 from pickyoptions import Option, Options
 from pickyoptions.core.options.exceptions import (
-    OptionsInvalidError, OptionsNotPopulatedError)
+    OptionDoesNotExistError, OptionsInvalidError, OptionsNotPopulatedError,
+    OptionsNotPopulatedPopulatingError)
 
 
 def test_options_deepcopy():
-    # TODO: Test with and without applying the populated values.
-    pass
+    # TODO: Test without applying the populated values.
+    options = Options(
+        Option('color', default='red'),
+        Option('height', required=True, types=(int, float)),
+    )
+    options.populate(height=4.0)
+
+    copied = deepcopy(options)
+    assert dict(copied) == dict(options)
+    assert copied.options[0] is not options.options[0]
+    assert copied.options[0].parent is copied
+    assert copied.get_option('color') is copied.options[0]
 
 
 def test_populate_options():
@@ -28,6 +40,25 @@ def test_populate_options():
     assert options.width == 0.0
 
 
+def test_populate_unrecognized_option():
+    options = Options(
+        Option('color', default='red'),
+        Option('height', required=True, types=(int, float)),
+    )
+    with pytest.raises(OptionDoesNotExistError) as e:
+        options.populate(height=4.0, width=2.0)
+    assert e.value.message == "There is no configured option width."
+
+
+def test_populate_options_normalized_default():
+    options = Options(
+        Option('color', default='red', normalize=lambda v, options: v.upper()),
+        Option('height', required=True, types=(int, float)),
+    )
+    options.populate(height=4.0)
+    assert options.color == 'RED'
+
+
 def test_populate_options_twice():
     pass
 
@@ -42,6 +73,18 @@ def test_access_value_unpopulated():
         options.width
 
 
+def test_assert_populated_or_populating():
+    options = Options(
+        Option('color', default='red'),
+        Option('height', required=True, types=(int, float)),
+    )
+    with pytest.raises(OptionsNotPopulatedPopulatingError):
+        options.assert_populated_or_populating()
+
+    options.populate(height=4.0)
+    options.assert_populated_or_populating()
+
+
 def test_populate_unspecified_unrequired_value():
     options = Options(
         Option('color', default='red'),
@@ -161,3 +204,67 @@ def test_restore_options_multiple_overrides():
         'height': 2.0,
         'width': 0.0,
     }
+
+
+def test_restore_options_does_not_revalidate():
+    validated = []
+
+    def validate_color(value, option):
+        validated.append(value)
+
+    options = Options(
+        Option('color', default='red', validate=validate_color),
+        Option('height', required=True, types=(int, float)),
+    )
+    options.populate(color='blue', height=2.0)
+    options.override(color='green')
+
+    num_validated = len(validated)
+    options.restore()
+    assert options.color == 'blue'
+    assert len(validated) == num_validated
+
+
+def test_local_override():
+    options = Options(
+        Option('color', default='red'),
+        Option('height', required=True, types=(int, float)),
+    )
+    options.populate(height=4.0)
+
+    @options.local_override
+    def get_dimensions(units):
+        return "%s%s %s" % (options.height, units, options.color)
+
+    assert get_dimensions('m') == "4.0m red"
+    assert get_dimensions('m', height=2.0) == "2.0m red"
+    assert get_dimensions('m', options={'color': 'blue'}) == "4.0m blue"
+    assert options.height == 4.0
+    assert options.color == 'red'
+
+
+def test_local_override_restore():
+    options = Options(
+        Option('color', default='red'),
+        Option('height', required=True, normalize=lambda v, option: v + 1),
+    )
+    options.populate(height=1)
+    options.override(color='blue')
+    assert options.height == 2
+
+    @options.local_override
+    def get_dimensions():
+        return "%s %s" % (options.height, options.color)
+
+    # The normalization is not reapplied to the already normalized values
+    # each time the decorated method is called.
+    assert get_dimensions(height=4) == "5 blue"
+    assert get_dimensions(height=4) == "5 blue"
+    assert options.height == 2
+    assert options.color == 'blue'
+
+    # The overrides applied before the decorated method was called remain, so
+    # the options can still be restored.
+    options.restore()
+    assert options.height == 2
+    assert options.color == 'red'